@@ -0,0 +1,198 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgClient.py
+# Description: Thin client for the decode server (nepgServer.py). Sends NE3
+#              program file paths to the server and prints the JSON responses
+#              (one line per program file) to screen. The exit code is 1 if
+#              a response is missing or reports an error.
+#
+#              The client is invoked once per program file by scripts, i.e.
+#              its startup must be cheaper than a nepgDump.py call: argparse,
+#              json, socket (enum, selectors) and threading are not imported
+#              for plain arguments and paths.
+#
+#              Usage: nepgClient.py [-h] [-p PORT] [-u SOCK] SRC [SRC ...]
+#
+#                SRC                   program file path(s) / '-' to read paths from stdin
+#                -h, --help            show this help message and exit
+#                -p PORT, --port PORT  connect to localhost:<PORT>
+#                -u SOCK, --unix SOCK  connect to Unix domain socket <SOCK>
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import sys, os, _socket
+
+# Default localhost port of decode server (see nepgServer.py)
+default_port = 47130
+
+# Number of requests sent before their responses are read (requests of a
+# batch must fit into the socket buffers while the server is not read)
+batch_size = 64
+
+# Command line options: short option, long option, help text
+#   (used by parse_args() and argparse)
+options = [
+    ('-p', '--port', "connect to localhost:<PORT>"),
+    ('-u', '--unix', "connect to Unix domain socket <SOCK>")]
+
+# Evaluated command line arguments
+class Args:
+    port = default_port
+    unix = None
+
+
+# ------------------------------------------------------------------------------
+# Function:    parse_args()
+#
+# Parameters:  argv  command line arguments
+# Returns:     args  evaluated command line arguments
+#
+# Description: Evaluates plain command line arguments directly to save the
+#              import of argparse; help output, invalid and ambiguous
+#              arguments (e.g. option values starting with '-') are passed
+#              to argparse
+# ------------------------------------------------------------------------------
+def parse_args(argv):
+
+    args = Args()
+    args.SRC = []
+    lookup = {}
+    for short, long, help in options:
+        lookup[short] = lookup[long] = long[2:]
+
+    plain = True
+    given = set()
+    i = 0
+    while i < len(argv) and plain:
+        arg = argv[i]
+        value = None
+        if arg.startswith('--') and '=' in arg:
+            arg, value = arg.split('=', 1)
+
+        if arg not in lookup:
+            if arg.startswith('-') and arg != '-':
+                plain = False
+            args.SRC.append(arg)
+        else:
+            dest = lookup[arg]
+            if value is None and i+1 < len(argv):
+                i += 1
+                value = argv[i]
+            if value is None or value.startswith('-') or dest in given or (dest == 'port' and not value.isdigit()):
+                plain = False
+            else:
+                given.add(dest)
+                setattr(args, dest, int(value) if dest == 'port' else value)
+        i += 1
+
+    if not plain or args.SRC == []:
+        import argparse
+        parser = argparse.ArgumentParser()
+        parser.add_argument("SRC", help = "program file path(s) / '-' to read paths from stdin", nargs = '+')
+        for short, long, help in options:
+            if long == '--port':
+                parser.add_argument(short, long, help = help, type = int, default = default_port)
+            else:
+                parser.add_argument(short, long, help = help)
+        args = parser.parse_args(argv)
+
+    return args
+
+
+# ------------------------------------------------------------------------------
+# Function:    make_request()
+#
+# Parameters:  path  program file path
+# Returns:           JSON request line
+#
+# Description: Creates request for a program file path (made absolute since
+#              the server may run elsewhere); json is only imported for paths
+#              with special characters
+# ------------------------------------------------------------------------------
+def make_request(path):
+
+    path = os.path.abspath(path)
+    if path.isprintable():
+        line = '{"path": "' + path.replace('\\', '\\\\').replace('"', '\\"') + '"}\n'
+    else:
+        import json
+        line = json.dumps({'path': path}) + '\n'
+
+    return line.encode()
+
+
+# ------------------------------------------------------------------------------
+# Function:    is_error()
+#
+# Parameters:  line  JSON response line
+# Returns:           True if response reports an error
+#
+# Description: Checks response without decoding it: the server writes the
+#              program parameters ("parms") as last item, i.e. only
+#              successful responses end with two closing braces
+# ------------------------------------------------------------------------------
+def is_error(line):
+
+    return not line.rstrip().endswith(b'}}')
+
+
+if __name__ == '__main__':
+    # Parse and evaluate command line arguments
+    args = parse_args(sys.argv[1:])
+
+    in_paths = []
+    for src in args.SRC:
+        if src == '-':
+            in_paths += [line.strip() for line in sys.stdin if line.strip()]
+        else:
+            in_paths.append(src)
+
+    try:
+        if args.unix:
+            sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+            sock.connect(args.unix)
+        else:
+            sock = _socket.socket(_socket.AF_INET, _socket.SOCK_STREAM)
+            sock.connect(('127.0.0.1', args.port))
+    except (OSError, OverflowError, AttributeError) as e:
+        print("Error: Cannot connect to nepgServer ({})".format(e), file = sys.stderr)
+        sys.exit(1)
+
+    # Requests are sent in batches, the responses of a batch are read before
+    # the next batch is sent (in the same order)
+    response_count = 0
+    error_count = 0
+    pending = b''
+    try:
+        for i in range(0, len(in_paths), batch_size):
+            batch = in_paths[i:i+batch_size]
+            sock.sendall(b''.join(make_request(in_path) for in_path in batch))
+            if i + batch_size >= len(in_paths):
+                sock.shutdown(_socket.SHUT_WR)
+
+            expected = response_count + len(batch)
+            while response_count < expected:
+                chunk = sock.recv(0x10000)
+                if chunk == b'':
+                    break
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop()
+                for line in lines:
+                    sys.stdout.write(line.decode() + '\n')
+                    response_count += 1
+                    if is_error(line):
+                        error_count += 1
+            if response_count < expected:
+                break
+    except OSError as e:
+        print("Error: Connection to nepgServer lost ({})".format(e), file = sys.stderr)
+    finally:
+        sock.close()
+
+    if response_count < len(in_paths):
+        print("Error: {} of {} responses missing".format(len(in_paths) - response_count, len(in_paths)), file = sys.stderr)
+    if response_count < len(in_paths) or error_count > 0:
+        sys.exit(1)
@@ -6,12 +6,17 @@
 #              files and either print them to screen or write them to a .csv file
 #              for import in Excel. The script is compatible with Python 2.7.
 #
-#              Usage: nepgDump.py [-h] [-d DST] [-f] SRC
+#              Usage: nepgDump.py [-h] [-d DST] [-f] [-s] [-j] [-o OUT] SRC
 #
-#                SRC                source file (w/o ext) / src folder with option '-f'
+#                SRC                source file (w/o ext) / .syx file / src folder with option '-f'
 #                -h, --help         show this help message and exit
 #                -d DST, --dst DST  write results to <DST>.csv / <SRC>.csv with '-d $'
-#                -f, --folder       process all .nepg files in folder <SRC>
+#                -f, --folder       process all .nepg and .syx files in folder <SRC>
+#                -s, --summary      print library statistics instead of program parameters
+#                -j, --json         print library statistics as JSON (implies '-s')
+#                -o OUT, --out OUT  write results to output <OUT> (repeatable):
+#                                   screen, csv:<FILE>, jsonl:<FILE>, summary,
+#                                   summary:<FILE> (<FILE> = '-': screen)
 #
 # Version:     1.4
 #
@@ -50,95 +55,224 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 # ==============================================================================
-import sys, os, argparse
-import nepgParser, nepgOut
+import sys, os
 
 version = 1.4
 
-print("\nnepgDump - Nord Electro 3 Program Parameter Dump, Vs {}".format(version))
-print("========================================================\n")
+# Command line options: short option, long option, argparse action, help text
+#   (used by parse_args() and argparse)
+options = [
+    ('-d', '--dst', 'store', "write results to <DST>.csv / <SRC>.csv with '-d $'"),
+    ('-f', '--folder', 'store_true', "process all .nepg and .syx files in folder <SRC>"),
+    ('-s', '--summary', 'store_true', "print library statistics instead of program parameters"),
+    ('-j', '--json', 'store_true', "print library statistics as JSON (implies '-s')"),
+    ('-o', '--out', 'append', "write results to output <OUT> (repeatable): screen, csv:<FILE>, jsonl:<FILE>, summary, summary:<FILE> (<FILE> = '-': screen)")]
+
+# Evaluated command line arguments
+class Args:
+    SRC = None
+
+
+# ------------------------------------------------------------------------------
+# Function:    parse_args()
+#
+# Parameters:  argv  command line arguments
+# Returns:     args  evaluated command line arguments
+#
+# Description: Evaluates plain command line arguments directly to save the
+#              import of argparse; help output, invalid and ambiguous
+#              arguments (e.g. option values starting with '-') are passed
+#              to argparse
+# ------------------------------------------------------------------------------
+def parse_args(argv):
+
+    args = Args()
+    lookup = {}
+    for short, long, action, help in options:
+        lookup[short] = lookup[long] = (long[2:], action)
+        setattr(args, long[2:], [] if action == 'append' else None if action == 'store' else False)
+
+    plain = True
+    i = 0
+    while i < len(argv) and plain:
+        arg = argv[i]
+        value = None
+        if arg.startswith('--') and '=' in arg:
+            arg, value = arg.split('=', 1)
+
+        if arg not in lookup:
+            if arg.startswith('-') or args.SRC is not None:
+                plain = False
+            args.SRC = arg
+        else:
+            dest, action = lookup[arg]
+            if action == 'store_true':
+                plain = value is None
+                setattr(args, dest, True)
+            else:
+                if value is None and i+1 < len(argv):
+                    i += 1
+                    value = argv[i]
+                if value is None or value.startswith('-') or (action == 'store' and getattr(args, dest) is not None):
+                    plain = False
+                elif action == 'store':
+                    setattr(args, dest, value)
+                else:
+                    getattr(args, dest).append(value)
+        i += 1
+
+    if not plain or args.SRC is None:
+        import argparse
+        parser = argparse.ArgumentParser()
+        parser.add_argument("SRC", help = "source file (w/o ext) / .syx file / src folder with option '-f'")
+        for short, long, action, help in options:
+            if action == 'append':
+                parser.add_argument(short, long, help = help, action = action, default = [])
+            else:
+                parser.add_argument(short, long, help = help, action = action)
+        args = parser.parse_args(argv)
+
+    # Options '-d', '-s' and '-j' are shortcuts for outputs
+    if args.dst == '$':
+        args.out.append('csv:' + str(args.SRC) + '.csv')
+    elif args.dst:
+        args.out.append('csv:' + str(args.dst) + '.csv')
+    if args.json:
+        args.out.append('summary:-')
+    elif args.summary:
+        args.out.append('summary')
+    if args.out == []:
+        args.out.append('screen')
+
+    return args
+
 
 # Parse and evaluate command line arguments
-parser = argparse.ArgumentParser()
-parser.add_argument("SRC", help = "source file (w/o ext) / src folder with option '-f'")
-parser.add_argument("-d", "--dst", help = "write results to <DST>.csv / <SRC>.csv with '-d $'")
-parser.add_argument("-f", "--folder", help = "process all .nepg files in folder <SRC>", action = "store_true")
-args = parser.parse_args()
+args = parse_args(sys.argv[1:])
+
+# Banner, progress and error messages are written to stderr if results
+# are written to stdout as data (csv:-, jsonl:-, summary:-)
+msg_out = sys.stdout
+for spec in args.out:
+    if spec.partition(':')[2] == '-':
+        msg_out = sys.stderr
+
+print("\nnepgDump - Nord Electro 3 Program Parameter Dump, Vs {}".format(version), file = msg_out)
+print("========================================================\n", file = msg_out)
+
+import nepgParser, nepgOut
 
 in_folder = ''
 in_files = ''
-out_file = ''
 
 if args.folder:
     if os.path.isdir(args.SRC):
         in_folder = str(args.SRC)
         in_files = os.listdir(str(args.SRC))
     else:
-        print("Error: Directory '{}' not found".format(args.SRC))
+        print("Error: Directory '{}' not found".format(args.SRC), file = msg_out)
         sys.exit()    
+elif str(args.SRC).endswith('.syx'):
+    in_files = [str(args.SRC)]
 else:
     in_files = [str(args.SRC) + '.nepg']
 
-if args.dst == '$':
-    out_file = str(args.SRC) + '.csv'
-elif args.dst:
-    out_file = str(args.dst) + '.csv'
+# Prepare outputs
+#   each program is parsed once and written to all outputs
+#   all outputs are checked before any output file is created
+for spec in args.out:
+    if not nepgOut.check_sink(spec):
+        print("Error: Invalid output '{}'".format(spec), file = msg_out)
+        sys.exit()
+
+sinks = []
+for spec in args.out:
+    sinks.append(nepgOut.open_sink(spec))
+
+# Progress messages are printed if no output is written to screen
+to_screen = False
+for sink in sinks:
+    if sink['type'] == 'screen' or sink['path'] in ('', '-'):
+        to_screen = True
+
+# ------------------------------------------------------------------------------
+# Function:    process_program()
+#
+# Parameters:  in_file    input file name (screen output)
+#              in_path    input file path (messages)
+#              nepg_name  NE3 program name (.csv output)
+#              data       string of input data from NE3 program file
+# Returns:                number of processed programs (0 / 1)
+#
+# Description: Checks and parses NE3 program and outputs the results
+# ------------------------------------------------------------------------------
+def process_program(in_file, in_path, nepg_name, data):
+
+    # Check for valid NE3 program file and file format
+    #   offs = 0xff indicates unknown file format
+    offs = nepgParser.get_offs(data)
+    if offs is not None:
+        if offs != 0xff:
+            # Parse NE3 program file
+            try:
+                nepg_parms = nepgParser.parse(data, offs)
+            except IndexError:
+                print("Error: File '{}' is truncated".format(in_path), file = msg_out)
+                return 0
+
+            if not to_screen:
+                print("Processing file '{}'".format(in_path), file = msg_out)
+
+            # Write results to all outputs
+            for sink in sinks:
+                nepgOut.write_sink(sink, in_file, nepg_name, nepg_parms)
+            return 1
+        else:
+            print("Error: File '{}' comprises unsupported file format".format(in_path), file = msg_out)
+    else:
+        print("Error: File '{}' is not a valid NE3 program file".format(in_path), file = msg_out)
+
+    return 0
 
-# Prepare .csv output file, if specified
-if out_file != '':
-    f_out = open(out_file, 'w', newline='')
-    f_out.write('sep=,\n')
-    nepgOut.write_csv_header(f_out)
 
 # Process input file(s)
+#   .nepg: single NE3 program file
+#   .syx:  SysEx file comprising any number of NE3 programs
 file_count = 0
+prog_count = 0
 for in_file in in_files:
-    if in_file.endswith('.nepg'):
+    if in_file.endswith('.nepg') or in_file.endswith('.syx'):
         file_count += 1
         if in_folder != '':
-          in_path = in_folder + '\\' + in_file
+          in_path = os.path.join(in_folder, in_file)
         else:
           in_path = in_file
 
         if os.path.isfile(in_path):
-            f_in = open(in_path, 'rb')
-            data = f_in.read()
-
-            # Check for valid NE3 program file
-            if (data[0x00:0x04] == b'CBIN') and (data[0x08:0x0c] == b'nepg'):
-                # Check file format (data[0x04] = 0: initial file format; 1: new file format)
-                if data[0x04] == 0x00:
-                    offs = 0x00
-                elif data[0x04] == 0x01:
-                    offs = 0x14
-                else:
-                    # offs = 0xff indicates unknown file format
-                    offs = 0xff
-
-                if offs != 0xff:
-                    # Parse NE3 program file
-                    nepg_parms = nepgParser.parse(data, offs)
-    
-                    if out_file == '':
-                        # Print results to screen 
-                        nepgOut.print_screen(in_file, nepg_parms)
+            nepg_name, ext = os.path.splitext(os.path.basename(in_path))
+            if ext == '.syx':
+                import nepgSysex
+                msg_no = 0
+                for msg_no, data in nepgSysex.read_programs(in_path):
+                    suffix = '#{}'.format(msg_no)
+                    if data is None:
+                        print("Error: SysEx message '{}' comprises unsupported format".format(in_path + suffix), file = msg_out)
                     else:
-                        # Write results to .csv file
-                        print("Processing file '{}'".format(in_path))
-                        nepg_name, ext = os.path.splitext(os.path.basename(in_path))
-                        nepgOut.write_csv_line(f_out, nepg_name, nepg_parms)
-                else:
-                    print("Error: File '{}' comprises unsupported file format".format(in_path))
+                        prog_count += process_program(in_file + suffix, in_path + suffix, nepg_name + suffix, data)
+                if msg_no == 0:
+                    print("Error: File '{}' comprises no NE3 SysEx messages".format(in_path), file = msg_out)
             else:
-                print("Error: File '{}' is not a valid NE3 program file".format(in_path))
-
-            f_in.close()    
+                f_in = open(in_path, 'rb')
+                data = f_in.read()
+                prog_count += process_program(in_file, in_path, nepg_name, data)
+                f_in.close()    
         else:
-          print("Error: File '{}' not found".format(in_path))
+          print("Error: File '{}' not found".format(in_path), file = msg_out)
 
 if file_count == 0:
-    print("Error: No NE3 program files found")
+    print("Error: No NE3 program files found", file = msg_out)
 
-if out_file != '':
-    print("\n{} files processed and results written to '{}'".format(file_count, out_file))
-    f_out.close()
\ No newline at end of file
+for sink in sinks:
+    nepgOut.close_sink(sink)
+    if sink['path'] not in ('', '-'):
+        print("\n{} programs processed and results written to '{}'".format(prog_count, sink['path']), file = msg_out)
\ No newline at end of file
@@ -9,7 +9,10 @@
 #
 # Date:        22.01.2025
 # ==============================================================================
-import csv
+import sys
+
+# Buffer size of output files (each output file is buffered separately)
+sink_buffer_size = 0x10000
 
 # ------------------------------------------------------------------------------
 # Function:    print_screen()
@@ -102,6 +105,8 @@ def print_screen(in_file, nepg_parms):
 # ------------------------------------------------------------------------------
 def write_csv_header(f_out):
 
+    import csv
+
     csv_header = ['Location', 'Program Name', 'Instrument', 'Piano Category', 'Piano Model', 'Clav EQ',\
         'Organ Model', 'Organ Drawbars (1/Lo)', 'Vibrato/Chorus (1/Lo)', 'Percussion (1/Lo)', 'Organ Drawbars (2/Up)',\
         'Vibrato/Chorus (2/Up)', 'Percussion (2/Up)', 'Rotary Speed', 'Preset/Split', 'Sample No', 'Sample Env',\
@@ -117,7 +122,7 @@ def write_csv_header(f_out):
 # ------------------------------------------------------------------------------
 # Function:    write_csv_line()
 #
-# Parameters:  f_out       file handle
+# Parameters:  writer      csv writer of .csv file
 #              nepg_name   NE3 program name
 #              nepg_parms  NE3 program parameters
 # Returns:     -
@@ -125,17 +130,156 @@ def write_csv_header(f_out):
 # Description: writes program parameters stored in dictionary 'nepg_parms'
 #              to a single line in .csv file
 # ------------------------------------------------------------------------------
-def write_csv_line(f_out, nepg_name, nepg_parms):
+def write_csv_line(writer, nepg_name, nepg_parms):
 
     # Add a leading whitespace character to float numbers to force formatting as text in Excel
+    # and add program name to parameter list ('nepg_parms' is left unchanged for other outputs)
+    row = []
     for key, value in nepg_parms.items():
-        if isinstance(value, float):
-            nepg_parms[key] = ' ' + str(value)
+        if key == 'progName':
+            row.append(nepg_name)
+        elif isinstance(value, float):
+            row.append(' ' + str(value))
+        else:
+            row.append(value)
+
+    writer.writerow(row)
+
+    return
+
+
+# ------------------------------------------------------------------------------
+# Function:    write_jsonl_line()
+#
+# Parameters:  f_out       file handle
+#              encoder     JSON encoder
+#              nepg_name   NE3 program name
+#              nepg_parms  NE3 program parameters
+# Returns:     -
+#
+# Description: writes program parameters stored in dictionary 'nepg_parms'
+#              to a single JSON line
+# ------------------------------------------------------------------------------
+def write_jsonl_line(f_out, encoder, nepg_name, nepg_parms):
 
-    # Add program name to parameter list
+    # Add program name to parameter list ('nepg_parms' is left unchanged for other outputs)
+    nepg_parms = dict(nepg_parms)
     nepg_parms['progName'] = nepg_name
 
-    writer = csv.writer(f_out, delimiter=',')
-    writer.writerow(nepg_parms.values())
+    f_out.write(encoder.encode({'name': nepg_name, 'parms': nepg_parms}) + '\n')
+
+    return
+
+
+# ------------------------------------------------------------------------------
+# Function:    check_sink()
+#
+# Parameters:  spec  output specification:
+#                      screen          program parameters to screen
+#                      csv:<FILE>      program parameters to .csv file
+#                      jsonl:<FILE>    program parameters to JSON lines file
+#                      summary         library statistics to screen
+#                      summary:<FILE>  library statistics to JSON file
+#                    <FILE> = '-' writes to screen
+# Returns:           True for valid specification
+#
+# Description: Checks output specification
+# ------------------------------------------------------------------------------
+def check_sink(spec):
+
+    sink_type, sep, path = spec.partition(':')
+
+    return (sink_type == 'screen' and sep == '') or (sink_type in ('csv', 'jsonl') and path != '') or\
+        (sink_type == 'summary' and (sep == '' or path != ''))
+
+
+# ------------------------------------------------------------------------------
+# Function:    open_sink()
+#
+# Parameters:  spec  output specification (see check_sink())
+# Returns:     sink  output sink / None for invalid specification
+#
+# Description: Opens output sink for program parameters; modules, writers and
+#              encoders are resolved once per sink
+# ------------------------------------------------------------------------------
+def open_sink(spec):
+
+    if not check_sink(spec):
+        return None
+
+    sink_type, sep, path = spec.partition(':')
+    sink = {'type': sink_type, 'path': path, 'f_out': None, 'writer': None, 'summary': None}
+
+    if sink_type in ('csv', 'jsonl'):
+        if path == '-':
+            # Line endings are written by the csv writer (no translation of
+            # '\n' to '\r\n' on Windows), as for files opened with newline=''
+            if sink_type == 'csv':
+                sys.stdout.reconfigure(newline='')
+            sink['f_out'] = sys.stdout
+        else:
+            sink['f_out'] = open(path, 'w', newline='', buffering = sink_buffer_size)
+        if sink_type == 'csv':
+            import csv
+            sink['f_out'].write('sep=,\n')
+            write_csv_header(sink['f_out'])
+            sink['writer'] = csv.writer(sink['f_out'], delimiter=',')
+        else:
+            import json
+            sink['writer'] = json.JSONEncoder()
+    elif sink_type == 'summary':
+        import nepgSummary
+        sink['writer'] = nepgSummary
+        sink['summary'] = nepgSummary.init_summary()
+
+    return sink
+
+
+# ------------------------------------------------------------------------------
+# Function:    write_sink()
+#
+# Parameters:  sink        output sink
+#              in_file     input file name
+#              nepg_name   NE3 program name
+#              nepg_parms  NE3 program parameters
+# Returns:     -
+#
+# Description: writes program parameters stored in dictionary 'nepg_parms'
+#              to output sink
+# ------------------------------------------------------------------------------
+def write_sink(sink, in_file, nepg_name, nepg_parms):
+
+    if sink['type'] == 'screen':
+        print_screen(in_file, nepg_parms)
+    elif sink['type'] == 'csv':
+        write_csv_line(sink['writer'], nepg_name, nepg_parms)
+    elif sink['type'] == 'jsonl':
+        write_jsonl_line(sink['f_out'], sink['writer'], nepg_name, nepg_parms)
+    elif sink['type'] == 'summary':
+        sink['writer'].add_summary(sink['summary'], nepg_parms)
+
+    return
+
+
+# ------------------------------------------------------------------------------
+# Function:    close_sink()
+#
+# Parameters:  sink  output sink
+# Returns:     -
+#
+# Description: Outputs library statistics and closes output file of sink
+# ------------------------------------------------------------------------------
+def close_sink(sink):
+
+    if sink['type'] == 'summary':
+        if sink['path'] == '':
+            sink['writer'].print_summary(sink['summary'])
+        elif sink['path'] == '-':
+            sink['writer'].write_summary_json(sys.stdout, sink['summary'])
+        else:
+            with open(sink['path'], 'w') as f_out:
+                sink['writer'].write_summary_json(f_out, sink['summary'])
+    elif sink['f_out'] is not None and sink['f_out'] is not sys.stdout:
+        sink['f_out'].close()
 
     return
\ No newline at end of file
@@ -9,7 +9,6 @@
 #
 # Date:        23.01.2025
 # ==============================================================================
-import collections
 
 # ------------------------------------------------------------------------------
 # Function:    get_int()
@@ -26,6 +25,29 @@ def get_int(msb, lsb, offs):
     return ((msb << (8-offs)) | (lsb >> offs)) & 0x7f
 
   
+# ------------------------------------------------------------------------------
+# Function:    get_offs()
+#
+# Parameters:  data  string of input data from NE3 program file
+# Returns:           data offset for file format / None if no NE3 program file
+#
+# Description: Check for valid NE3 program file and get data offset of
+#              file format (0xff indicates unknown file format)
+# ------------------------------------------------------------------------------
+def get_offs(data):
+
+    if (data[0x00:0x04] != b'CBIN') or (data[0x08:0x0c] != b'nepg'):
+        return None
+
+    # Check file format (data[0x04] = 0: initial file format; 1: new file format)
+    if data[0x04] == 0x00:
+        return 0x00
+    elif data[0x04] == 0x01:
+        return 0x14
+    else:
+        return 0xff
+
+  
 # ------------------------------------------------------------------------------
 # Function:    parse()
 #
@@ -38,11 +60,11 @@ def get_int(msb, lsb, offs):
 def parse(data, offs):
 
     # NE3 program parameters
-    nepg_parms = collections.OrderedDict([('progLoc', ''), ('progName', ''), ('instr', ''), ('pianoCategory', ''), ('pianoModel', ''), ('clavEq', ''),\
-        ('organModel', ''), ('organDrawbars#1', ''), ('organVib#1', ''), ('organPerc#1', ''), ('organDrawbars#2', ''), ('organVib#2', ''), ('organPerc#2', ''),\
-        ('organRotarySpeed', ''), ('organPresetSplit', ''), ('sampleNo', ''), ('sampleEnv', ''), ('eff1Type', ''), ('eff1Rate', ''), ('eff2Type', ''),\
-        ('eff2Rate', ''), ('spkCompType', ''), ('spkCompRate', ''), ('revType', ''), ('revMix', ''), ('eqState', ''), ('eqBassGain', ''), ('eqMidFreq', ''),\
-        ('eqMidGain', ''), ('eqTrebleGain', ''), ('progGain', '')])
+    nepg_parms = {'progLoc': '', 'progName': '', 'instr': '', 'pianoCategory': '', 'pianoModel': '', 'clavEq': '',\
+        'organModel': '', 'organDrawbars#1': '', 'organVib#1': '', 'organPerc#1': '', 'organDrawbars#2': '', 'organVib#2': '', 'organPerc#2': '',\
+        'organRotarySpeed': '', 'organPresetSplit': '', 'sampleNo': '', 'sampleEnv': '', 'eff1Type': '', 'eff1Rate': '', 'eff2Type': '',\
+        'eff2Rate': '', 'spkCompType': '', 'spkCompRate': '', 'revType': '', 'revMix': '', 'eqState': '', 'eqBassGain': '', 'eqMidFreq': '',\
+        'eqMidGain': '', 'eqTrebleGain': '', 'progGain': ''}
 
     # Program location (0x0e, mask 0xff)
     b = data[0x0e]
@@ -63,9 +85,9 @@ def parse(data, offs):
     #     0x17: Piano, EPiano
     #     0x18: Piano, Wurl
     #     0x19: Piano, Clav/Hps
-    instruments = ['Sample Lib', '', '', '', 'Organ', 'Organ', 'Organ', 'Piano', 'Piano', 'Piano', 'Piano', 'Piano', '', '', '', '', '', '']
-    piano_categories = ['', '', '', '', '', '', '', 'Grand', 'Upright', 'EPiano', 'Wurl', 'Clav/Hps', '', '', '', '', '', '']
-    organ_models = ['', '', '', '', 'B3', 'Farf', 'Vox', '', '', '', '', '', '', '', '', '', '', '']
+    instruments = ('Sample Lib', '', '', '', 'Organ', 'Organ', 'Organ', 'Piano', 'Piano', 'Piano', 'Piano', 'Piano', '', '', '', '', '', '')
+    piano_categories = ('', '', '', '', '', '', '', 'Grand', 'Upright', 'EPiano', 'Wurl', 'Clav/Hps', '', '', '', '', '', '')
+    organ_models = ('', '', '', '', 'B3', 'Farf', 'Vox', '', '', '', '', '', '', '', '', '', '', '')
     i = (data[0x10] & 0x1f) - 0x0e
     nepg_parms['instr'] = instruments[i]
     if nepg_parms['instr'] == 'Piano':
@@ -105,8 +127,8 @@ def parse(data, offs):
             #     0x20: Medium
             #     0x40: Treble
             #     0x80: Brilliant
-            clav_eq_settings = ['Off', 'Soft', 'Med', 'Soft/Med', 'Treb', 'Soft + Treb', 'Med + Treb', 'Soft/Med + Treb',\
-                'Brill', 'Soft + Brill', 'Med + Brill', 'Soft/Med + Brill', 'Treb/Brill', 'Soft + Treb/Brill', 'Med + Treb/Brill', 'Soft/Med + Treb/Brill']
+            clav_eq_settings = ('Off', 'Soft', 'Med', 'Soft/Med', 'Treb', 'Soft + Treb', 'Med + Treb', 'Soft/Med + Treb',\
+                'Brill', 'Soft + Brill', 'Med + Brill', 'Soft/Med + Brill', 'Treb/Brill', 'Soft + Treb/Brill', 'Med + Treb/Brill', 'Soft/Med + Treb/Brill')
             i = (data[0x57+offs] & 0xf0) >> 4
             nepg_parms['clavEq'] = clav_eq_settings[i]
   
@@ -155,7 +177,7 @@ def parse(data, offs):
             #     0x30: C2
             #     0x40: V3
             #     0x50: C3
-            organ_vib_settings = ['V1', 'C1', 'V2', 'C2', 'V3', 'C3', '', '']
+            organ_vib_settings = ('V1', 'C1', 'V2', 'C2', 'V3', 'C3', '', '')
             if data[0x37+offs] & 0x08:
                 i = (data[0x37+offs] & 0x70) >> 4
                 nepg_parms['organVib#1'] = organ_vib_settings[i]
@@ -181,7 +203,7 @@ def parse(data, offs):
             #     0x20: None
             #     0x40: Soft/Fast
             #     0x60: Fast
-            organ_perc_settings = ['Soft', 'Soft + Third', '', 'Third', 'Soft/Fast', 'Soft/Fast + Third', 'Fast', 'Fast + Third']
+            organ_perc_settings = ('Soft', 'Soft + Third', '', 'Third', 'Soft/Fast', 'Soft/Fast + Third', 'Fast', 'Fast + Third')
             if data[0x38+offs] & 0x08:
                 i = (data[0x38+offs] & 0x70) >> 4
                 nepg_parms['organPerc#1'] = organ_perc_settings[i]
@@ -201,7 +223,7 @@ def parse(data, offs):
             #   data[0x24] & 0x20:
             #     0x00: 1/Lo
             #     0x20: 2/Up
-            organ_preset_split_settings = ['1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split']
+            organ_preset_split_settings = ('1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split')
             i = ((data[0x23+offs] & 0x20) >> 4) | ((data[0x24+offs] & 0x20) >> 5)
             nepg_parms['organPresetSplit'] = organ_preset_split_settings[i]
       
@@ -247,7 +269,7 @@ def parse(data, offs):
             #     0x01: Heavy1
             #     0x02: Light2
             #     0x03: Heavy2
-            organ_vib_settings = ['Light1', 'Heavy1', 'Light2', 'Heavy2']
+            organ_vib_settings = ('Light1', 'Heavy1', 'Light2', 'Heavy2')
             if data[0x38+offs] & 0x80:
                 i = data[0x37+offs] & 0x03
                 nepg_parms['organVib#1'] = organ_vib_settings[i]
@@ -267,7 +289,7 @@ def parse(data, offs):
             #   data[0x24] & 0x08:
             #     0x00: 1/Lo
             #     0x08: 2/Up
-            organ_preset_split_settings = ['1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split']
+            organ_preset_split_settings = ('1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split')
             i = ((data[0x23+offs] & 0x20) >> 4) | ((data[0x24+offs] & 0x08) >> 3)
             nepg_parms['organPresetSplit'] = organ_preset_split_settings[i]
 
@@ -325,7 +347,7 @@ def parse(data, offs):
             #   data[0x24] & 0x10:
             #     0x00: 1/Lo
             #     0x10: 2/Up
-            organ_preset_split_settings = ['1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split']
+            organ_preset_split_settings = ('1/Lo', '2/Up', '1/Lo + Split', '2/Up + Split')
             i = ((data[0x23+offs] & 0x20) >> 4) | ((data[0x24+offs] & 0x10) >> 4)
             nepg_parms['organPresetSplit'] = organ_preset_split_settings[i]
 
@@ -344,8 +366,8 @@ def parse(data, offs):
         #     0x0200: SlowAt
         #     0x0400: VelDyn
         #     0x0600: SlowAt/VelDyn
-        sample_env_settings = ['Off', 'Rel1', 'Rel2', 'Rel3', 'SlowAt', 'Rel1 + SlowAt', 'Rel2 + SlowAt', 'Rel3 + SlowAT',\
-            'VelDyn', 'Rel1 + VelDyn', 'Rel2 + VelDyn', 'Rel3 + VelDyn', 'SlowAt/VelDyn', 'Rel1 + SlowAt/VelDyn', 'Rel2 + SlowAt/VelDyn', 'Rel3 + SlowAt/VelDyn']
+        sample_env_settings = ('Off', 'Rel1', 'Rel2', 'Rel3', 'SlowAt', 'Rel1 + SlowAt', 'Rel2 + SlowAt', 'Rel3 + SlowAT',\
+            'VelDyn', 'Rel1 + VelDyn', 'Rel2 + VelDyn', 'Rel3 + VelDyn', 'SlowAt/VelDyn', 'Rel1 + SlowAt/VelDyn', 'Rel2 + SlowAt/VelDyn', 'Rel3 + SlowAt/VelDyn')
         i = ((data[0x57+offs] << 1) | (data[0x58+offs] >> 7)) & 0x0f
         nepg_parms['sampleEnv'] = sample_env_settings[i]
 
@@ -368,7 +390,7 @@ def parse(data, offs):
     if (nepg_parms['instr'] == 'Organ') and (data[0x70+offs] & 0x40) or\
         (nepg_parms['instr'] == 'Piano') and (data[0x7b+offs] & 0x40) or\
         (nepg_parms['instr'] == 'Sample Lib') and (data[0x7b+offs] & 0x40):
-        eff1_types = ['Trem1', 'Trem2', 'Trem3', 'Pan1', 'Pan2', 'Pan3', 'A-Wa', 'P-Wa', 'RM', '', '', '', '', '', '', '']
+        eff1_types = ('Trem1', 'Trem2', 'Trem3', 'Pan1', 'Pan2', 'Pan3', 'A-Wa', 'P-Wa', 'RM', '', '', '', '', '', '', '')
         i = (data[0x63+offs] & 0x1e) >> 1
         nepg_parms['eff1Type'] = eff1_types[i]
   
@@ -396,7 +418,7 @@ def parse(data, offs):
     if (nepg_parms['instr'] == 'Organ') and (data[0x70+offs] & 0x20) or\
         (nepg_parms['instr'] == 'Piano') and (data[0x7b+offs] & 0x20) or\
         (nepg_parms['instr'] == 'Sample Lib') and (data[0x7b+offs] & 0x20):
-        eff2_types = ['Phas1', 'Phas2', 'Phas3', 'Flang1', 'Flang2', 'Flang3', 'Chor1', 'Chor2', 'Chor3', '', '', '', '', '', '', '']
+        eff2_types = ('Phas1', 'Phas2', 'Phas3', 'Flang1', 'Flang2', 'Flang3', 'Chor1', 'Chor2', 'Chor3', '', '', '', '', '', '', '')
         i = ((data[0x64+offs] << 2) | (data[0x65+offs] >> 6)) & 0x0f
         nepg_parms['eff2Type'] = eff2_types[i]
 
@@ -420,7 +442,7 @@ def parse(data, offs):
     if (nepg_parms['instr'] == 'Organ') and (data[0x70+offs] & 0x10) or\
         (nepg_parms['instr'] == 'Piano') and (data[0x7b+offs] & 0x10) or\
         (nepg_parms['instr'] == 'Sample Lib') and (data[0x7b+offs] & 0x10):
-        spk_comp_types = ['Small', 'JC', 'Twin', 'Comp', 'Rotary', '', '', '']
+        spk_comp_types = ('Small', 'JC', 'Twin', 'Comp', 'Rotary', '', '', '')
         i = (data[0x66+offs] & 0x70) >> 4
         nepg_parms['spkCompType'] = spk_comp_types[i]
   
@@ -444,7 +466,7 @@ def parse(data, offs):
     if (nepg_parms['instr'] == 'Organ') and (data[0x70+offs] & 0x08) or\
         (nepg_parms['instr'] == 'Piano') and (data[0x7b+offs] & 0x08) or\
         (nepg_parms['instr'] == 'Sample Lib') and (data[0x7b+offs] & 0x08):
-        rev_types = ['Room', 'Stage', 'Hall', 'Stage Soft', 'Hall Soft', '', '', '']
+        rev_types = ('Room', 'Stage', 'Hall', 'Stage Soft', 'Hall Soft', '', '', '')
         i = (data[0x67+offs] & 0x1c) >> 2
         nepg_parms['revType'] = rev_types[i]
    
@@ -495,7 +517,7 @@ def parse(data, offs):
         #     0x04: Stop Mode + Slow/Stop
         #     0x06: Stop Mode + Fast
         if nepg_parms['spkCompType'] == 'Rotary':
-            organ_rotary_settings = ['Slow/Stop', 'Fast', 'Stop Mode + Slow/Stop', 'Stop Mode + Fast']
+            organ_rotary_settings = ('Slow/Stop', 'Fast', 'Stop Mode + Slow/Stop', 'Stop Mode + Fast')
             i = (data[0x68+offs] & 0x06) >> 1
             nepg_parms['organRotarySpeed'] = organ_rotary_settings[i]
         else:
@@ -0,0 +1,171 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgServer.py
+# Description: Decode server keeping the NE3 program parser loaded between
+#              requests. Clients connect via localhost TCP port or Unix domain
+#              socket and send one JSON request per line:
+#
+#                {"path": "<program file>"}
+#                {"name": "<program name>", "data": "<base64 file contents>"}
+#
+#              Each request is answered by one JSON line containing either the
+#              program parameters ("parms") or an error message ("error").
+#              Connections are handled concurrently in separate threads.
+#
+#              Usage: nepgServer.py [-h] [-p PORT] [-u SOCK]
+#
+#                -h, --help            show this help message and exit
+#                -p PORT, --port PORT  listen on localhost:<PORT>
+#                -u SOCK, --unix SOCK  listen on Unix domain socket <SOCK>
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import sys, os, stat, argparse, json, base64, threading, socketserver
+import nepgParser
+
+# Default localhost port of decode server
+default_port = 47130
+
+# Maximum number of cached results (program files decoded by path)
+cache_size = 4096
+
+cache = {}
+cache_lock = threading.Lock()
+
+# ------------------------------------------------------------------------------
+# Function:    decode()
+#
+# Parameters:  name  program name used in error messages
+#              data  string of input data from NE3 program file
+# Returns:           response dictionary
+#
+# Description: Checks and parses NE3 program file contents
+# ------------------------------------------------------------------------------
+def decode(name, data):
+
+    offs = nepgParser.get_offs(data)
+    if offs is None:
+        return {'name': name, 'error': "File '{}' is not a valid NE3 program file".format(name)}
+    elif offs == 0xff:
+        return {'name': name, 'error': "File '{}' comprises unsupported file format".format(name)}
+
+    try:
+        return {'name': name, 'parms': nepgParser.parse(data, offs)}
+    except IndexError:
+        return {'name': name, 'error': "File '{}' is truncated".format(name)}
+
+
+# ------------------------------------------------------------------------------
+# Function:    decode_path()
+#
+# Parameters:  path  path of NE3 program file
+# Returns:           response dictionary
+#
+# Description: Reads and decodes NE3 program file, results are cached by
+#              path, modification time and size of the file
+# ------------------------------------------------------------------------------
+def decode_path(path):
+
+    try:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        with cache_lock:
+            response = cache.get(key)
+        if response is not None:
+            return response
+
+        with open(path, 'rb') as f_in:
+            data = f_in.read()
+    except FileNotFoundError:
+        return {'name': path, 'error': "File '{}' not found".format(path)}
+    except OSError as e:
+        return {'name': path, 'error': "File '{}' cannot be read ({})".format(path, e.strerror)}
+
+    response = decode(path, data)
+
+    with cache_lock:
+        if len(cache) >= cache_size:
+            cache.clear()
+        cache[key] = response
+
+    return response
+
+
+# ------------------------------------------------------------------------------
+# Function:    handle_request()
+#
+# Parameters:  line  JSON request line
+# Returns:           JSON response line
+#
+# Description: Evaluates a single client request
+# ------------------------------------------------------------------------------
+def handle_request(line):
+
+    try:
+        request = json.loads(line)
+        if 'path' in request:
+            response = decode_path(str(request['path']))
+        elif 'data' in request:
+            name = str(request.get('name', ''))
+            response = decode(name, base64.b64decode(request['data']))
+        else:
+            response = {'error': "Request comprises neither 'path' nor 'data'"}
+    except (ValueError, TypeError, AttributeError) as e:
+        response = {'error': 'Invalid request: {}'.format(e)}
+
+    return json.dumps(response) + '\n'
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_request(line).encode())
+                self.wfile.flush()
+
+
+class TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+if __name__ == '__main__':
+    # Parse and evaluate command line arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-p", "--port", help = "listen on localhost:<PORT>", type = int, default = default_port)
+    parser.add_argument("-u", "--unix", help = "listen on Unix domain socket <SOCK>")
+    args = parser.parse_args()
+
+    if args.unix:
+        if not hasattr(socketserver, 'UnixStreamServer'):
+            print("Error: Unix domain sockets not supported on this platform")
+            sys.exit(1)
+        if os.path.exists(args.unix):
+            if not stat.S_ISSOCK(os.stat(args.unix).st_mode):
+                print("Error: '{}' exists and is not a socket".format(args.unix))
+                sys.exit(1)
+            os.remove(args.unix)
+        server = UnixServer(args.unix, RequestHandler)
+        address = args.unix
+    else:
+        server = TCPServer(('127.0.0.1', args.port), RequestHandler)
+        address = 'localhost:{}'.format(args.port)
+
+    print("nepgServer listening on '{}'".format(address), flush = True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix:
+            os.remove(args.unix)
@@ -0,0 +1,114 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgStartup.py
+# Description: Startup regression check for nepgDump.py. Runs a single file
+#              dump with 'python -X importtime' and fails (exit code 1) if the
+#              modules imported by nepgDump.py exceed the import time budget
+#              or if modules are imported which are only needed for other
+#              options (e.g. argparse, csv).
+#
+#              Usage: nepgStartup.py [-h] [-b BUDGET]
+#
+#                -h, --help            show this help message and exit
+#                -b BUDGET, --budget BUDGET
+#                                      import time budget in us
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import sys, os, argparse, subprocess, tempfile
+
+# Import time budget for a single file dump to screen in us
+# (measured: approx. 600 us with cached bytecode)
+default_budget = 3000
+
+# Modules which must not be imported for a single file dump to screen
+lazy_modules = ['argparse', 'csv', 'collections', 'json']
+
+# ------------------------------------------------------------------------------
+# Function:    get_import_times()
+#
+# Parameters:  args     command line arguments of nepgDump.py
+# Returns:     imports  list of (module, cumulative import time in us) for all
+#                       imports after interpreter startup (nested imports
+#                       indented by their nesting level) / None if nepgDump.py
+#                       failed
+#
+# Description: Runs nepgDump.py with '-X importtime' and evaluates the
+#              import times printed to stderr
+# ------------------------------------------------------------------------------
+def get_import_times(args):
+
+    # Bytecode cache is enabled to measure startup as on a user's computer
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nepgDump.py')
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run([sys.executable, '-X', 'importtime', script] + args,\
+        stdout = subprocess.DEVNULL, stderr = subprocess.PIPE, universal_newlines = True, env = env)
+    if result.returncode != 0:
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                print(line)
+        return None
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        module = fields[2].rstrip()
+        if module == ' site':
+            # Interpreter startup completed, ignore imports so far
+            imports = []
+            continue
+        imports.append((module[1:], int(fields[1])))
+
+    return imports
+
+
+if __name__ == '__main__':
+    # Parse and evaluate command line arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-b", "--budget", help = "import time budget in us", type = int, default = default_budget)
+    args = parser.parse_args()
+
+    # Create minimal NE3 program file for a single file dump
+    tmp_dir = tempfile.mkdtemp()
+    src = os.path.join(tmp_dir, 'startup')
+    with open(src + '.nepg', 'wb') as f_out:
+        f_out.write(b'CBIN' + bytes(4) + b'nepg' + bytes(0x90))
+
+    # Warm-up run writes bytecode cache
+    imports = get_import_times([src])
+    if imports is not None:
+        imports = get_import_times([src])
+
+    os.remove(src + '.nepg')
+    os.rmdir(tmp_dir)
+
+    if imports is None:
+        print("Error: nepgDump.py failed")
+        sys.exit(1)
+
+    # Nested imports are contained in cumulative time of top level imports
+    total = 0
+    for module, us in imports:
+        print("{:>8} us  {}".format(us, module))
+        if not module.startswith(' '):
+            total += us
+    print("{:>8} us  total (budget {} us)".format(total, args.budget))
+
+    failed = False
+    if total > args.budget:
+        print("Error: Import time budget exceeded")
+        failed = True
+    for module, us in imports:
+        if module.strip() in lazy_modules:
+            print("Error: Module '{}' imported at startup".format(module))
+            failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,155 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgSummary.py
+# Description: Contains functions to aggregate NE3 program parameters of a
+#              program library into library statistics. Only counters and
+#              fixed-bin histograms are kept, i.e. memory does not grow with
+#              the number of programs.
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import collections
+
+# Program Gain histogram: 10 bins of width 1.0 (last bin includes 10.0)
+prog_gain_bins = 10
+
+# Counted program parameters and their titles
+counted_parms = [('instr', 'Instrument'), ('model', 'Instrument/Model'), ('eff1Type', 'Effect 1'),\
+    ('eff2Type', 'Effect 2'), ('spkCompType', 'Speaker/Comp'), ('revType', 'Reverb'), ('eqState', 'Equalizer')]
+
+# ------------------------------------------------------------------------------
+# Function:    init_summary()
+#
+# Parameters:  -
+# Returns:     summary  empty library statistics
+#
+# Description: Creates counters and histograms of library statistics
+# ------------------------------------------------------------------------------
+def init_summary():
+
+    summary = {'programs': 0, 'progGain': [0] * prog_gain_bins, 'progLoc': collections.Counter()}
+    for key, title in counted_parms:
+        summary[key] = collections.Counter()
+
+    return summary
+
+
+# ------------------------------------------------------------------------------
+# Function:    add_summary()
+#
+# Parameters:  summary     library statistics
+#              nepg_parms  NE3 program parameters
+# Returns:     -
+#
+# Description: Adds program parameters stored in dictionary 'nepg_parms'
+#              to library statistics
+# ------------------------------------------------------------------------------
+def add_summary(summary, nepg_parms):
+
+    summary['programs'] += 1
+
+    instr = nepg_parms['instr']
+    if instr == 'Piano':
+        model = '{} {} {}'.format(instr, nepg_parms['pianoCategory'], nepg_parms['pianoModel'])
+    elif instr == 'Organ':
+        model = '{} {}'.format(instr, nepg_parms['organModel'])
+    elif instr == 'Sample Lib':
+        model = '{} {}'.format(instr, nepg_parms['sampleNo'])
+    else:
+        model = instr
+
+    summary['instr'][instr] += 1
+    summary['model'][model] += 1
+    summary['eff1Type'][nepg_parms['eff1Type']] += 1
+    summary['eff2Type'][nepg_parms['eff2Type']] += 1
+    summary['spkCompType'][nepg_parms['spkCompType']] += 1
+    summary['revType'][nepg_parms['revType']] += 1
+    summary['eqState'][nepg_parms['eqState']] += 1
+    summary['progLoc'][nepg_parms['progLoc']] += 1
+
+    summary['progGain'][min(int(nepg_parms['progGain']), prog_gain_bins-1)] += 1
+
+    return
+
+
+# ------------------------------------------------------------------------------
+# Function:    get_summary()
+#
+# Parameters:  summary  library statistics
+# Returns:     result   library statistics as dictionary of plain types
+#
+# Description: Converts library statistics for output, counters are sorted
+#              by decreasing count
+# ------------------------------------------------------------------------------
+def get_summary(summary):
+
+    result = collections.OrderedDict([('programs', summary['programs'])])
+    for key, title in counted_parms:
+        result[key] = collections.OrderedDict(summary[key].most_common())
+
+    result['progGain'] = collections.OrderedDict()
+    for i in range(prog_gain_bins):
+        result['progGain']['{:.1f}-{:.1f}'.format(i, i+1)] = summary['progGain'][i]
+
+    result['progLocOccupied'] = len(summary['progLoc'])
+    result['progLocMultiple'] = collections.OrderedDict(sorted(
+        [(loc, count) for loc, count in summary['progLoc'].items() if count > 1],
+        key = lambda item: (int(item[0][:-1]), item[0][-1])))
+
+    return result
+
+
+# ------------------------------------------------------------------------------
+# Function:    print_summary()
+#
+# Parameters:  summary  library statistics
+# Returns:     -
+#
+# Description: Prints library statistics to screen
+# ------------------------------------------------------------------------------
+def print_summary(summary):
+
+    result = get_summary(summary)
+
+    # Assemble output string
+    str = '+++++ Summary +++++'
+    str += '\n\nPrograms:         {}'.format(result['programs'])
+
+    for key, title in counted_parms:
+        str += '\n\n{}:'.format(title)
+        for value, count in result[key].items():
+            str += '\n  {:<30}{:>8}'.format(value if value != '' else '(none)', count)
+
+    str += '\n\nProgram Gain:'
+    for bin, count in result['progGain'].items():
+        str += '\n  {:<30}{:>8}'.format(bin, count)
+
+    str += '\n\nProgram location: {} occupied'.format(result['progLocOccupied'])
+    for loc, count in result['progLocMultiple'].items():
+        str += '\n  {:<30}{:>8}'.format(loc, count)
+
+    print(str + '\n')
+
+    return
+
+
+# ------------------------------------------------------------------------------
+# Function:    write_summary_json()
+#
+# Parameters:  f_out    file handle
+#              summary  library statistics
+# Returns:     -
+#
+# Description: Writes library statistics as JSON
+# ------------------------------------------------------------------------------
+def write_summary_json(f_out, summary):
+
+    import json
+
+    json.dump(get_summary(summary), f_out, indent = 2)
+    f_out.write('\n')
+
+    return
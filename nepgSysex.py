@@ -0,0 +1,163 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgSysex.py
+# Description: Contains functions to read NE3 programs from MIDI SysEx bulk
+#              dump files (.syx). A SysEx file may contain any number of
+#              messages; each Clavia message is expected to carry one program
+#              in the byte layout of a NE3 program file, packed in 7 bit MIDI
+#              data bytes:
+#
+#                0xf0 0x33 <header (3 bytes)> <packed program data> 0xf7
+#
+#              Packed data consists of groups of 8 bytes: the first byte holds
+#              the most significant bits of the following 7 data bytes (bit 0
+#              for the first data byte, bit 6 for the last one). The last group
+#              may be incomplete.
+#
+#              Note: The SysEx format of the NE3 is not documented. Only
+#              messages whose unpacked data starts with the program file
+#              header of the Nord Sound Manager ('CBIN' ... 'nepg') are
+#              accepted as programs; other Clavia messages are reported as
+#              unsupported.
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import mmap
+import nepgParser
+
+# Clavia manufacturer id
+clavia_id = 0x33
+
+# Number of header bytes following the manufacturer id (device id, model id,
+# message type)
+header_len = 3
+
+# Translation tables: MSB byte -> most significant bit of data byte 0..6
+msb_tables = [bytes(((m >> j) & 0x01) << 7 for m in range(256)) for j in range(7)]
+
+# ------------------------------------------------------------------------------
+# Function:    unpack()
+#
+# Parameters:  packed  packed program data (7 bit MIDI data bytes)
+#              buf     output buffer
+# Returns:     n       number of unpacked bytes stored in 'buf'
+#
+# Description: Unpacks 7 bit MIDI data bytes into 8 bit data bytes. Each of
+#              the 7 data byte positions of a group is processed at once for
+#              all groups (strided slices combined as long integers).
+# ------------------------------------------------------------------------------
+def unpack(packed, buf):
+
+    groups, rest = divmod(len(packed), 8)
+    n = groups * 7 + max(rest - 1, 0)
+    msbs = packed[0::8].tobytes()
+
+    for j in range(min(n, 7)):
+        lsbs = packed[j+1::8]
+        count = len(lsbs)
+        value = int.from_bytes(lsbs, 'big') | int.from_bytes(msbs[:count].translate(msb_tables[j]), 'big')
+        buf[j:n:7] = value.to_bytes(count, 'big')
+
+    return n
+
+
+# ------------------------------------------------------------------------------
+# Function:    read_programs()
+#
+# Parameters:  in_path  path of SysEx file
+# Yields:               message number, program data / None for unsupported
+#                       message format (no program file header)
+#
+# Description: Scans SysEx file for Clavia messages and yields the unpacked
+#              program data. The program data is a view of a buffer which is
+#              reused for the next message, i.e. it is only valid until the
+#              next program is requested. The buffer grows with the longest
+#              message.
+# ------------------------------------------------------------------------------
+def read_programs(in_path):
+
+    with open(in_path, 'rb') as f_in:
+        if f_in.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f_in.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            buf = bytearray()
+            buf_view = memoryview(buf)
+            data = None
+            try:
+                msg_count = 0
+                start = mm.find(b'\xf0')
+                while start >= 0:
+                    end = mm.find(b'\xf7', start + 1)
+                    if end < 0:
+                        break
+
+                    # Skip incomplete message (new message starts before end)
+                    next_start = mm.find(b'\xf0', start + 1, end)
+                    if next_start >= 0:
+                        start = next_start
+                        continue
+
+                    if end - start > 2 + header_len and mm[start + 1] == clavia_id:
+                        msg_count += 1
+                        packed = view[start + 2 + header_len:end]
+                        if len(buf) < len(packed):
+                            # Unpacked data is always shorter than packed data
+                            buf_view.release()
+                            buf = bytearray(len(packed))
+                            buf_view = memoryview(buf)
+                        n = unpack(packed, buf)
+                        packed.release()
+                        data = buf_view[:n]
+                        if nepgParser.get_offs(data) is None:
+                            yield msg_count, None
+                        else:
+                            yield msg_count, data
+                        data.release()
+
+                    start = mm.find(b'\xf0', end + 1)
+            finally:
+                if data is not None:
+                    data.release()
+                buf_view.release()
+                view.release()
+
+
+# ------------------------------------------------------------------------------
+# Function:    pack()
+#
+# Parameters:  data    program data (8 bit data bytes)
+# Returns:     packed  packed program data (7 bit MIDI data bytes)
+#
+# Description: Packs 8 bit data bytes into 7 bit MIDI data bytes (inverse of
+#              unpack())
+# ------------------------------------------------------------------------------
+def pack(data):
+
+    packed = bytearray()
+    for i in range(0, len(data), 7):
+        group = data[i:i+7]
+        msb = 0
+        for j in range(len(group)):
+            msb |= (group[j] >> 7) << j
+        packed.append(msb)
+        packed += bytes(b & 0x7f for b in group)
+
+    return bytes(packed)
+
+
+# ------------------------------------------------------------------------------
+# Function:    make_message()
+#
+# Parameters:  data  NE3 program file contents
+# Returns:           Clavia SysEx message
+#
+# Description: Creates SysEx message of NE3 program in the format expected by
+#              read_programs() (header bytes 0x00)
+# ------------------------------------------------------------------------------
+def make_message(data):
+
+    return bytes([0xf0, clavia_id]) + bytes(header_len) + pack(data) + b'\xf7'
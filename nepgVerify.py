@@ -0,0 +1,338 @@
+# ==============================================================================
+# nepgDump - Nord Electro 3 Program Parameter Dump
+#
+# Module:      nepgVerify.py
+# Description: Differential check and benchmark of alternative parser engines
+#              against the reference parser nepgParser.parse(). Both engines
+#              parse the same generated program data of both file formats:
+#
+#                - edge cases: every byte read by the parser is swept through
+#                  all 256 values for every instrument, once with all other
+#                  bytes 0x00 and once with all other bytes 0xff (i.e. with
+#                  enabled effects and reverb)
+#                - random program data (valid and invalid instrument codes)
+#
+#              Additionally, random programs are packed into a SysEx file and
+#              read back by nepgSysex.read_programs() (round trip).
+#
+#              Results must be equal in field order, value and type; raised
+#              exceptions must be of the same type. The first mismatch is
+#              reported with its program data, followed by the throughput of
+#              both engines. The exit code is 1 for a mismatch, i.e. the check
+#              can be used as test.
+#
+#              Usage: nepgVerify.py [-h] [-n COUNT] [-s SEED] [-b] [ENGINE]
+#
+#                ENGINE                candidate engine <module>[:<function>]
+#                                      (default: nepgParser:parse)
+#                -h, --help            show this help message and exit
+#                -n COUNT, --count COUNT
+#                                      number of random programs (default 20000)
+#                -s SEED, --seed SEED  seed of random programs (default 0)
+#                -b, --bench           repeat throughput measurement more often
+#                                      (best of 25 instead of best of 5)
+#
+# Author:      Hans Juergen Miks
+#
+# Date:        19.10.2026
+# ==============================================================================
+import sys, os, argparse, importlib, random, time, tempfile
+import nepgParser, nepgSysex
+
+# Size of generated program data (largest offset read by parser: 0x7b + 0x14)
+data_size = 0xa0
+
+# Data offsets of file formats (data[0x04] = 0: initial file format; 1: new file format)
+formats = [(0x00, 0x00), (0x01, 0x14)]
+
+# Instrument codes (data[0x10] & 0x1f) of Sample Lib, Organ and Piano models
+instr_codes = [0x0e, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19]
+
+# Number of programs per block of throughput measurement
+measure_block = 500
+
+# Bytes read by the parser (relative to data offset of file format)
+parm_bytes = [0x23, 0x24] + list(range(0x2d, 0x39)) + list(range(0x3f, 0x4b)) +\
+    list(range(0x51, 0x59)) + list(range(0x5f, 0x69)) + [0x70, 0x7b]
+
+# ------------------------------------------------------------------------------
+# Function:    make_program()
+#
+# Parameters:  fmt    file format (data[0x04])
+#              fill   program data (bytes after file header)
+#              instr  instrument code (data[0x10])
+#              loc    program location (data[0x0e])
+# Returns:     data   NE3 program file contents
+#
+# Description: Assembles NE3 program file contents
+# ------------------------------------------------------------------------------
+def make_program(fmt, fill, instr, loc):
+
+    data = bytearray(fill)
+    data[0x00:0x04] = b'CBIN'
+    data[0x04] = fmt
+    data[0x08:0x0c] = b'nepg'
+    data[0x0e] = loc
+    data[0x10] = instr
+
+    return bytes(data)
+
+
+# ------------------------------------------------------------------------------
+# Function:    edge_programs()
+#
+# Parameters:  -
+# Yields:      data, offs  NE3 program file contents, data offset
+#
+# Description: Generates edge cases: all values of every instrument code and
+#              all values of every parameter byte for every instrument, other
+#              bytes 0x00 and 0xff (enable bits of effects set)
+# ------------------------------------------------------------------------------
+def edge_programs():
+
+    for fmt, offs in formats:
+        for base in (0x00, 0xff):
+            for instr in range(256):
+                yield make_program(fmt, bytes([base]) * data_size, instr, instr), offs
+
+        for instr in instr_codes:
+            for pos in parm_bytes:
+                for base in (0x00, 0xff):
+                    fill = bytearray([base]) * data_size
+                    for value in range(256):
+                        fill[pos + offs] = value
+                        yield make_program(fmt, fill, instr, value), offs
+
+
+# ------------------------------------------------------------------------------
+# Function:    random_programs()
+#
+# Parameters:  count  number of programs
+#              seed   seed of random generator
+# Returns:            list of NE3 program file contents, data offset
+#
+# Description: Generates random programs, mostly with valid instrument codes
+# ------------------------------------------------------------------------------
+def random_programs(count, seed):
+
+    rnd = random.Random(seed)
+    programs = []
+    for i in range(count):
+        fmt, offs = rnd.choice(formats)
+        fill = rnd.getrandbits(8 * data_size).to_bytes(data_size, 'little')
+        if rnd.random() < 0.9:
+            instr = rnd.choice(instr_codes) | (rnd.getrandbits(3) << 5)
+        else:
+            instr = rnd.getrandbits(8)
+        programs.append((make_program(fmt, fill, instr, rnd.getrandbits(8)), offs))
+
+    return programs
+
+
+# ------------------------------------------------------------------------------
+# Function:    run_engine()
+#
+# Parameters:  engine  parser function
+#              data    NE3 program file contents
+#              offs    data offset
+# Returns:             program parameters as list of (key, value) / exception
+#
+# Description: Runs parser and catches exceptions for comparison
+# ------------------------------------------------------------------------------
+def run_engine(engine, data, offs):
+
+    try:
+        return list(engine(data, offs).items())
+    except Exception as e:
+        return e
+
+
+# ------------------------------------------------------------------------------
+# Function:    compare()
+#
+# Parameters:  ref   result of reference parser
+#              cand  result of candidate engine
+# Returns:           description of first mismatch / None if equal
+#
+# Description: Compares parser results field by field (order, value, type)
+# ------------------------------------------------------------------------------
+def compare(ref, cand):
+
+    if isinstance(ref, list) and ref == cand and\
+        [type(value) for key, value in ref] == [type(value) for key, value in cand]:
+        return None
+
+    if isinstance(ref, Exception) or isinstance(cand, Exception):
+        if type(ref) is type(cand):
+            return None
+        return "result: reference {!r}, candidate {!r}".format(ref, cand)
+
+    for n in range(max(len(ref), len(cand))):
+        if n >= len(ref):
+            return "field #{} '{}': missing in reference".format(n, cand[n][0])
+        if n >= len(cand):
+            return "field #{} '{}': missing in candidate".format(n, ref[n][0])
+        (ref_key, ref_value), (cand_key, cand_value) = ref[n], cand[n]
+        if ref_key != cand_key:
+            return "field #{}: reference '{}', candidate '{}'".format(n, ref_key, cand_key)
+        if type(ref_value) is not type(cand_value) or ref_value != cand_value:
+            return "field '{}': reference {!r}, candidate {!r}".format(ref_key, ref_value, cand_value)
+
+    return None
+
+
+# ------------------------------------------------------------------------------
+# Function:    verify()
+#
+# Parameters:  engine    candidate parser function
+#              programs  iterable of NE3 program file contents, data offset
+# Returns:     count     number of checked programs
+#              mismatch  description of first mismatch / None if equal
+#
+# Description: Runs reference parser and candidate engine side by side
+# ------------------------------------------------------------------------------
+def verify(engine, programs):
+
+    count = 0
+    for data, offs in programs:
+        count += 1
+        mismatch = compare(run_engine(nepgParser.parse, data, offs), run_engine(engine, data, offs))
+        if mismatch is not None:
+            return count, "{}\n  offs = 0x{:02x}, data = {}".format(mismatch, offs, data.hex())
+
+    return count, None
+
+
+# ------------------------------------------------------------------------------
+# Function:    measure()
+#
+# Parameters:  engines   list of parser functions
+#              programs  list of NE3 program file contents, data offset
+#              repeat    number of measurements
+# Returns:               list of programs per second (best measurement)
+#
+# Description: Measures throughput of parsers; after a warm-up pass the
+#              parsers are measured alternately on blocks of programs within
+#              each repetition (order changing), the best time of each block
+#              is used
+# ------------------------------------------------------------------------------
+def measure(engines, programs, repeat):
+
+    blocks = [programs[i:i+measure_block] for i in range(0, len(programs), measure_block)]
+    best = [[None] * len(blocks) for engine in engines]
+    for i in range(repeat + 1):
+        for b, block in enumerate(blocks):
+            order = range(len(engines)) if (i + b) % 2 == 0 else reversed(range(len(engines)))
+            for n in order:
+                engine = engines[n]
+                start = time.perf_counter()
+                for data, offs in block:
+                    engine(data, offs)
+                elapsed = time.perf_counter() - start
+                if i > 0 and (best[n][b] is None or elapsed < best[n][b]):
+                    best[n][b] = elapsed
+
+    return [len(programs) / sum(times) for times in best]
+
+
+# ------------------------------------------------------------------------------
+# Function:    verify_sysex()
+#
+# Parameters:  programs  list of NE3 program file contents, data offset
+# Returns:     count     number of checked SysEx messages
+#              mismatch  description of first mismatch / None if equal
+#
+# Description: Writes programs as SysEx file together with messages which
+#              must be skipped (other manufacturer, incomplete message) or
+#              reported as unsupported (no program file header) and checks
+#              the programs read back by nepgSysex.read_programs()
+# ------------------------------------------------------------------------------
+def verify_sysex(programs):
+
+    expected = []
+    syx = bytearray(b'\xf0\x41\x10\x42\x12\x00\xf7')
+    for n, (data, offs) in enumerate(programs):
+        syx += nepgSysex.make_message(data)
+        expected.append(data)
+        if n % 100 == 0:
+            syx += nepgSysex.make_message(data[0x0c:])
+            expected.append(None)
+            syx += b'\xf0\x33\x00\x00'
+    syx += b'\xf0\x33\x00'
+
+    f_out, path = tempfile.mkstemp(suffix = '.syx')
+    with os.fdopen(f_out, 'wb') as f:
+        f.write(syx)
+
+    try:
+        count = 0
+        for msg_no, data in nepgSysex.read_programs(path):
+            count += 1
+            if count > len(expected):
+                return count, "unexpected message #{}".format(msg_no)
+            if data is None or expected[count-1] is None:
+                if data is not expected[count-1]:
+                    return count, "message #{}: program file header mismatch".format(msg_no)
+            elif data != expected[count-1]:
+                return count, "message #{}: program data mismatch".format(msg_no)
+        if count != len(expected):
+            return count, "{} of {} messages read".format(count, len(expected))
+    finally:
+        os.remove(path)
+
+    return count, None
+
+
+# ------------------------------------------------------------------------------
+# Function:    load_engine()
+#
+# Parameters:  spec    engine <module>[:<function>]
+# Returns:             parser function
+#
+# Description: Imports candidate engine (default function: parse)
+# ------------------------------------------------------------------------------
+def load_engine(spec):
+
+    module, sep, function = spec.partition(':')
+
+    return getattr(importlib.import_module(module), function or 'parse')
+
+
+if __name__ == '__main__':
+    # Parse and evaluate command line arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("ENGINE", help = "candidate engine <module>[:<function>] (default: nepgParser:parse)", nargs = '?', default = 'nepgParser:parse')
+    parser.add_argument("-n", "--count", help = "number of random programs (default 20000)", type = int, default = 20000)
+    parser.add_argument("-s", "--seed", help = "seed of random programs (default 0)", type = int, default = 0)
+    parser.add_argument("-b", "--bench", help = "repeat throughput measurement more often (best of 25 instead of best of 5)", action = "store_true")
+    args = parser.parse_args()
+
+    try:
+        engine = load_engine(args.ENGINE)
+    except (ImportError, AttributeError) as e:
+        print("Error: Engine '{}' not found ({})".format(args.ENGINE, e))
+        sys.exit(1)
+
+    programs = random_programs(args.count, args.seed)
+
+    for title, cases in (('Edge cases', edge_programs()), ('Random programs', programs)):
+        count, mismatch = verify(engine, cases)
+        if mismatch is not None:
+            print("{}: mismatch in program #{}: {}".format(title, count, mismatch))
+            sys.exit(1)
+        print("{}: {} programs equal".format(title, count))
+
+    count, mismatch = verify_sysex(programs[:2000])
+    if mismatch is not None:
+        print("SysEx round trip: mismatch: {}".format(mismatch))
+        sys.exit(1)
+    print("SysEx round trip: {} messages equal".format(count))
+
+    if programs == []:
+        sys.exit(0)
+
+    repeat = 25 if args.bench else 5
+    ref_rate, cand_rate = measure([nepgParser.parse, engine], programs, repeat)
+    print("\nReference: {:>10.0f} programs/s".format(ref_rate))
+    print("Candidate: {:>10.0f} programs/s".format(cand_rate))
+    print("Ratio:     {:>10.2f}".format(cand_rate / ref_rate))